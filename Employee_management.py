@@ -1,394 +1,897 @@
-import json
-from abc import ABC, abstractmethod
-
-# Abstract Base Employee Class
-class Employee(ABC):
-    def __init__(self, employee_id: str, name: str, department: str):
-        self._employee_id = employee_id
-        self._name = name
-        self._department = department
-
-    @property
-    def employee_id(self):
-        return self._employee_id
-
-    @property
-    def name(self):
-        return self._name
-
-    @property
-    def department(self):
-        return self._department
-
-    @department.setter
-    def department(self, value):
-        self._department = value
-
-    @abstractmethod
-    def calculate_salary(self) -> float:
-        pass
-
-    def display_details(self) -> str:
-        return f"ID: {self._employee_id}, Name: {self._name}, Dept: {self._department}"
-
-    def to_dict(self) -> dict:
-        return {
-            'employee_id': self._employee_id,
-            'name': self._name,
-            'department': self._department
-        }
-
-# Full Time Employee Class
-class FullTimeEmployee(Employee):
-    def __init__(self, employee_id: str, name: str, department: str, monthly_salary: float):
-        super().__init__(employee_id, name, department)
-        self._monthly_salary = monthly_salary
-
-    @property
-    def monthly_salary(self):
-        return self._monthly_salary
-
-    @monthly_salary.setter
-    def monthly_salary(self, value):
-        if value >= 0:
-            self._monthly_salary = value
-        else:
-            print("Monthly salary cannot be negative")
-
-    def calculate_salary(self) -> float:
-        return self._monthly_salary
-
-    def display_details(self) -> str:
-        base_details = super().display_details()
-        return f"{base_details}, Monthly Salary: ₹{self._monthly_salary}"
-
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data.update({
-            'monthly_salary': self._monthly_salary,
-            'type': 'fulltime'
-        })
-        return data
-
-# Part Time Employee Class
-class PartTimeEmployee(Employee):
-    def __init__(self, employee_id: str, name: str, department: str, hourly_rate: float, hours_worked_per_month: float):
-        super().__init__(employee_id, name, department)
-        self._hourly_rate = hourly_rate
-        self._hours_worked_per_month = hours_worked_per_month
-
-    @property
-    def hourly_rate(self):
-        return self._hourly_rate
-
-    @hourly_rate.setter
-    def hourly_rate(self, value):
-        if value >= 0:
-            self._hourly_rate = value
-        else:
-            print("Hourly rate cannot be negative")
-
-    @property
-    def hours_worked_per_month(self):
-        return self._hours_worked_per_month
-
-    @hours_worked_per_month.setter
-    def hours_worked_per_month(self, value):
-        if value >= 0:
-            self._hours_worked_per_month = value
-        else:
-            print("Hours worked cannot be negative")
-
-    def calculate_salary(self) -> float:
-        return self._hourly_rate * self._hours_worked_per_month
-
-    def display_details(self) -> str:
-        base_details = super().display_details()
-        return f"{base_details}, Hourly Rate: ₹{self._hourly_rate}, Hours/Month: {self._hours_worked_per_month}"
-
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data.update({
-            'hourly_rate': self._hourly_rate,
-            'hours_worked_per_month': self._hours_worked_per_month,
-            'type': 'parttime'
-        })
-        return data
-
-# Manager Class (inherits from FullTimeEmployee)
-class Manager(FullTimeEmployee):
-    def __init__(self, employee_id: str, name: str, department: str, monthly_salary: float, bonus: float):
-        super().__init__(employee_id, name, department, monthly_salary)
-        self._bonus = bonus
-
-    @property
-    def bonus(self):
-        return self._bonus
-
-    @bonus.setter
-    def bonus(self, value):
-        if value >= 0:
-            self._bonus = value
-        else:
-            print("Bonus cannot be negative")
-
-    def calculate_salary(self) -> float:
-        return super().calculate_salary() + self._bonus
-
-    def display_details(self) -> str:
-        base_details = super().display_details()
-        return f"{base_details}, Bonus: ₹{self._bonus}"
-
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data.update({
-            'bonus': self._bonus,
-            'type': 'manager'
-        })
-        return data
-
-# Company Class
-class Company:
-    def __init__(self, data_file: str = 'employees.json'):
-        self._employees = {}
-        self._data_file = data_file
-        self._load_data()
-
-    def _load_data(self):
-        try:
-            with open(self._data_file, 'r') as file:
-                data = json.load(file)
-                for emp in data:
-                    emp_type = emp.get('type')
-                    if emp_type == 'fulltime':
-                        employee = FullTimeEmployee(
-                            emp['employee_id'], emp['name'], emp['department'], emp['monthly_salary'])
-                    elif emp_type == 'parttime':
-                        employee = PartTimeEmployee(
-                            emp['employee_id'], emp['name'], emp['department'],
-                            emp['hourly_rate'], emp['hours_worked_per_month'])
-                    elif emp_type == 'manager':
-                        employee = Manager(
-                            emp['employee_id'], emp['name'], emp['department'],
-                            emp['monthly_salary'], emp['bonus'])
-                    else:
-                        continue
-                    self._employees[emp['employee_id']] = employee
-        except FileNotFoundError:
-            print("No existing employee data found. Starting with empty database.")
-        except json.JSONDecodeError:
-            print("Invalid JSON file format. Starting with empty database.")
-
-    def _save_data(self):
-        try:
-            with open(self._data_file, 'w') as file:
-                data = [employee.to_dict() for employee in self._employees.values()]
-                json.dump(data, file, indent=4)
-        except Exception as e:
-            print(f"Error saving data: {e}")
-
-    def add_employee(self, employee: Employee) -> bool:
-        if employee.employee_id in self._employees:
-            return False
-        self._employees[employee.employee_id] = employee
-        self._save_data()
-        return True
-
-    def remove_employee(self, employee_id: str) -> bool:
-        if employee_id in self._employees:
-            del self._employees[employee_id]
-            self._save_data()
-            return True
-        return False
-
-    def find_employee(self, employee_id: str):
-        return self._employees.get(employee_id, None)
-
-    def search_employee_by_name(self, name: str):
-        found_employees = []
-        for employee in self._employees.values():
-            if name.lower() in employee.name.lower():
-                found_employees.append(employee)
-        return found_employees
-
-    def calculate_total_payroll(self) -> float:
-        total = 0
-        for employee in self._employees.values():
-            total += employee.calculate_salary()
-        return total
-
-    def display_all_employees(self):
-        if not self._employees:
-            print("No employees found.")
-            return
-
-        print("\n" + "="*80)
-        print("ALL EMPLOYEES")
-        print("="*80)
-        print(f"{'ID':<10} {'Name':<20} {'Department':<15} {'User Type':<15} {'Details'}")
-        print("-"*80)
-        for employee in self._employees.values():
-            user_type = type(employee).__name__
-            base_details = employee.display_details()
-            print(f"{employee.employee_id:<10} {employee.name:<20} {employee.department:<15} {user_type:<15} {base_details}")
-        print("="*80)
-
-    def generate_payroll_report(self):
-        if not self._employees:
-            print("No employees found.")
-            return
-
-        print("\n" + "="*100)
-        print("PAYROLL REPORT")
-        print("="*100)
-        print(f"{'ID':<10} {'Name':<20} {'Dept':<15} {'Type':<15} {'Salary':<15}")
-        print("-"*100)
-
-        total_payroll = 0
-        for employee in self._employees.values():
-            salary = employee.calculate_salary()
-            total_payroll += salary
-            user_type = type(employee).__name__
-            print(f"{employee.employee_id:<10} {employee.name:<20} {employee.department:<15} {user_type:<15} ₹{salary:<14.2f}")
-
-        print("-"*100)
-        print(f"{'TOTAL PAYROLL:':<75} ₹{total_payroll:.2f}")
-        print("="*100)
-
-# Main Application Interface
-def main():
-    company = Company()
-
-    while True:
-        print("\n" + "="*50)
-        print("EMPLOYEE MANAGEMENT SYSTEM v1.0\n \t\t\t By Jai , Aditya & Himanshu")
-        print("="*50)
-        print("1. Add Employee")
-        print("2. Remove Employee")
-        print("3. Search Employee by ID")
-        print("4. Search Employee by Name")
-        print("5. Display All Employees")
-        print("6. Calculate Total Payroll")
-        print("7. Generate Payroll Report")
-        print("8. Exit")
-        print("="*50)
-
-        try:
-            choice = input("Enter your choice (1-8): ").strip()
-
-            if choice == '1':
-                while True:
-                    print("\nEmployee Types:")
-                    print("1. Full-time Employee")
-                    print("2. Part-time Employee")
-                    print("3. Manager")
-                    print("0. Back to Main Menu")
-
-                    emp_type = input("Select employee type (0-3): ").strip()
-                    if emp_type == '0':
-                        break
-
-                    emp_id = input("Enter Employee ID: ").strip()
-                    if company.find_employee(emp_id):
-                        print("Employee with this ID already exists!")
-                        continue
-
-                    name = input("Enter Employee Name: ").strip()
-                    department = input("Enter Department: ").strip()
-
-                    if emp_type == '1':
-                        try:
-                            monthly_salary = float(input("Enter Monthly Salary: ₹"))
-                            employee = FullTimeEmployee(emp_id, name, department, monthly_salary)
-                        except ValueError:
-                            print("Invalid salary amount!")
-                            continue
-
-                    elif emp_type == '2':
-                        try:
-                            hourly_rate = float(input("Enter Hourly Rate: ₹"))
-                            hours_worked = float(input("Enter Hours Worked per Month: "))
-                            employee = PartTimeEmployee(emp_id, name, department, hourly_rate, hours_worked)
-                        except ValueError:
-                            print("Invalid input!")
-                            continue
-
-                    elif emp_type == '3':
-                        try:
-                            monthly_salary = float(input("Enter Monthly Salary: ₹"))
-                            bonus = float(input("Enter Monthly Bonus: ₹"))
-                            employee = Manager(emp_id, name, department, monthly_salary, bonus)
-                        except ValueError:
-                            print("Invalid input!")
-                            continue
-
-                    else:
-                        print("Invalid employee type!")
-                        continue
-
-                    if company.add_employee(employee):
-                        print("Employee added successfully!")
-                    else:
-                        print("Failed to add employee!")
-                    break
-
-            elif choice == '2':
-                emp_id = input("Enter Employee ID to remove (or 0 to cancel): ").strip()
-                if emp_id == '0':
-                    continue
-                if company.remove_employee(emp_id):
-                    print("Employee removed successfully!")
-                else:
-                    print("Employee not found!")
-
-            elif choice == '3':
-                emp_id = input("Enter Employee ID to search (or 0 to cancel): ").strip()
-                if emp_id == '0':
-                    continue
-                employee = company.find_employee(emp_id)
-                if employee:
-                    print("\nEmployee Found:")
-                    print("-" * 40)
-                    print(employee.display_details())
-                    print(f"Monthly Salary: ₹{employee.calculate_salary():.2f}")
-                else:
-                    print("Employee not found!")
-
-            elif choice == '4':
-                name = input("Enter Employee Name to search (or 0 to cancel): ").strip()
-                if name == '0':
-                    continue
-                employees = company.search_employee_by_name(name)
-                if employees:
-                    print(f"\nFound {len(employees)} employee(s):")
-                    print("-" * 40)
-                    for emp in employees:
-                        print(emp.display_details())
-                else:
-                    print("No employees found with that name!")
-
-            elif choice == '5':
-                company.display_all_employees()
-
-            elif choice == '6':
-                total = company.calculate_total_payroll()
-                print(f"\nTotal Company Payroll: ₹{total:.2f}")
-
-            elif choice == '7':
-                company.generate_payroll_report()
-
-            elif choice == '8':
-                print("Thank you for using Employee Management System!")
-                break
-
-            else:
-                print("Invalid choice! Please enter a number between 1-8.")
-
-        except KeyboardInterrupt:
-            print("\n\nExiting Employee Management System...")
-            break
-        except Exception as e:
-            print(f"An error occurred: {e}")
-
-if __name__ == "__main__":
-    main()
+import atexit
+import json
+import mmap
+import os
+import queue
+import sys
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from itertools import chain
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+    try:
+        from ijson.backends import yajl2_c as ijson_backend
+    except ImportError:
+        ijson_backend = ijson
+    _JSON_ERRORS = (json.JSONDecodeError, UnicodeDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+try:
+    from sortedcontainers import SortedDict
+except ImportError:
+    SortedDict = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# JSON helpers: use orjson when available, stdlib json otherwise.
+# Both work on bytes so the data file is always opened in binary mode, and
+# dumps emits a single line so records can be stored as JSONL.
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Read-only memoryview over an open binary file, backed by mmap so parsing
+# reads straight from the page cache. Empty files cannot be mapped.
+@contextmanager
+def _mapped(file):
+    if os.fstat(file.fileno()).st_size == 0:
+        yield memoryview(b'')
+        return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        yield view
+
+
+_WHITESPACE = b' \t\r\n\x0b\x0c'
+
+
+# Zero-copy line slices of a _mapped() view. Each slice is released when the
+# next one is requested, so callers must parse a line before moving on.
+def _iter_lines(view):
+    find = view.obj.find
+    pos, size = 0, len(view)
+    while pos < size:
+        end = find(b'\n', pos)
+        if end == -1:
+            end = size
+        with view[pos:end] as line:
+            yield line
+        pos = end + 1
+
+# Row templates for the employee and payroll reports, parsed once at import.
+# Fields 0-3 are id, name, department and type; the rest are per class.
+_ROW_PREFIX = "{0:<10} {1:<20} {2:<15} {3:<15} "
+_ROW_FMT = (_ROW_PREFIX + "{4}").format
+_PAY_FMT = "{:<10} {:<20} {:<15} {:<15} ₹{:<14.2f}".format
+
+if HAS_NUMBA:
+    # Payroll over Company's struct-of-arrays columns. An explicit loop
+    # vectorizes better under LLVM than nested np.where.
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _payroll_kernel(type_code, monthly, hourly, hours, bonus):
+        total = 0.0
+        for i in prange(type_code.shape[0]):
+            code = type_code[i]
+            if code == 1:
+                total += hourly[i] * hours[i]
+            elif code == 2:
+                total += monthly[i] + bonus[i]
+            else:
+                total += monthly[i]
+        return total
+
+# Abstract Base Employee Class
+class Employee(ABC):
+    __slots__ = ('_employee_id', '_name', '_department', '_company', '_details_cache')
+    # Type label shown in reports; each subclass overrides it with its class name
+    USER_TYPE = 'Employee'
+
+    def __init__(self, employee_id: str, name: str, department: str):
+        self._employee_id = employee_id
+        self._name = name
+        self._department = department
+        # Owning Company, set on add so setters can report changes to it
+        self._company = None
+        self._details_cache = None
+
+    @property
+    def employee_id(self):
+        return self._employee_id
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def department(self):
+        return self._department
+
+    @department.setter
+    def department(self, value):
+        self._department = value
+        self._notify_change()
+
+    def _notify_change(self):
+        self._details_cache = None
+        if self._company is not None:
+            self._company._employee_changed(self)
+
+    @abstractmethod
+    def calculate_salary(self) -> float:
+        pass
+
+    # display_details() is memoized; subclasses extend _format_details()
+    # and every setter clears the cache through _notify_change()
+    def display_details(self) -> str:
+        if self._details_cache is None:
+            self._details_cache = self._format_details()
+        return self._details_cache
+
+    def _format_details(self) -> str:
+        return f"ID: {self._employee_id}, Name: {self._name}, Dept: {self._department}"
+
+    # Each concrete class builds its full record in a single dict literal,
+    # so saving allocates one dict per employee
+    @abstractmethod
+    def to_dict(self) -> dict:
+        pass
+
+    # Fallback report row built from the cached details; the concrete
+    # classes override it with a flat template
+    def render_row(self) -> str:
+        return _ROW_FMT(self._employee_id, self._name, self._department, self.USER_TYPE, self.display_details())
+
+# Full Time Employee Class
+class FullTimeEmployee(Employee):
+    __slots__ = ('_monthly_salary',)
+    USER_TYPE = 'FullTimeEmployee'
+    _ROW_TEMPLATE = (_ROW_PREFIX + "ID: {0}, Name: {1}, Dept: {2}, Monthly Salary: ₹{4}").format
+
+    def __init__(self, employee_id: str, name: str, department: str, monthly_salary: float):
+        super().__init__(employee_id, name, department)
+        self._monthly_salary = monthly_salary
+
+    @property
+    def monthly_salary(self):
+        return self._monthly_salary
+
+    @monthly_salary.setter
+    def monthly_salary(self, value):
+        if value >= 0:
+            self._monthly_salary = value
+            self._notify_change()
+        else:
+            print("Monthly salary cannot be negative")
+
+    def calculate_salary(self) -> float:
+        return self._monthly_salary
+
+    def _format_details(self) -> str:
+        base_details = super()._format_details()
+        return f"{base_details}, Monthly Salary: ₹{self._monthly_salary}"
+
+    def to_dict(self) -> dict:
+        return {
+            'employee_id': self._employee_id,
+            'name': self._name,
+            'department': self._department,
+            'monthly_salary': self._monthly_salary,
+            'type': 'fulltime'
+        }
+
+    def render_row(self) -> str:
+        return self._ROW_TEMPLATE(self._employee_id, self._name, self._department, self.USER_TYPE,
+                                  self._monthly_salary)
+
+
+# Part Time Employee Class
+class PartTimeEmployee(Employee):
+    __slots__ = ('_hourly_rate', '_hours_worked_per_month')
+    USER_TYPE = 'PartTimeEmployee'
+    _ROW_TEMPLATE = (_ROW_PREFIX + "ID: {0}, Name: {1}, Dept: {2}, Hourly Rate: ₹{4}, Hours/Month: {5}").format
+
+    def __init__(self, employee_id: str, name: str, department: str, hourly_rate: float, hours_worked_per_month: float):
+        super().__init__(employee_id, name, department)
+        self._hourly_rate = hourly_rate
+        self._hours_worked_per_month = hours_worked_per_month
+
+    @property
+    def hourly_rate(self):
+        return self._hourly_rate
+
+    @hourly_rate.setter
+    def hourly_rate(self, value):
+        if value >= 0:
+            self._hourly_rate = value
+            self._notify_change()
+        else:
+            print("Hourly rate cannot be negative")
+
+    @property
+    def hours_worked_per_month(self):
+        return self._hours_worked_per_month
+
+    @hours_worked_per_month.setter
+    def hours_worked_per_month(self, value):
+        if value >= 0:
+            self._hours_worked_per_month = value
+            self._notify_change()
+        else:
+            print("Hours worked cannot be negative")
+
+    def calculate_salary(self) -> float:
+        return self._hourly_rate * self._hours_worked_per_month
+
+    def _format_details(self) -> str:
+        base_details = super()._format_details()
+        return f"{base_details}, Hourly Rate: ₹{self._hourly_rate}, Hours/Month: {self._hours_worked_per_month}"
+
+    def to_dict(self) -> dict:
+        return {
+            'employee_id': self._employee_id,
+            'name': self._name,
+            'department': self._department,
+            'hourly_rate': self._hourly_rate,
+            'hours_worked_per_month': self._hours_worked_per_month,
+            'type': 'parttime'
+        }
+
+    def render_row(self) -> str:
+        return self._ROW_TEMPLATE(self._employee_id, self._name, self._department, self.USER_TYPE,
+                                  self._hourly_rate, self._hours_worked_per_month)
+
+
+# Manager Class (inherits from FullTimeEmployee)
+class Manager(FullTimeEmployee):
+    __slots__ = ('_bonus',)
+    USER_TYPE = 'Manager'
+    _ROW_TEMPLATE = (_ROW_PREFIX + "ID: {0}, Name: {1}, Dept: {2}, Monthly Salary: ₹{4}, Bonus: ₹{5}").format
+
+    def __init__(self, employee_id: str, name: str, department: str, monthly_salary: float, bonus: float):
+        super().__init__(employee_id, name, department, monthly_salary)
+        self._bonus = bonus
+
+    @property
+    def bonus(self):
+        return self._bonus
+
+    @bonus.setter
+    def bonus(self, value):
+        if value >= 0:
+            self._bonus = value
+            self._notify_change()
+        else:
+            print("Bonus cannot be negative")
+
+    def calculate_salary(self) -> float:
+        return super().calculate_salary() + self._bonus
+
+    def _format_details(self) -> str:
+        base_details = super()._format_details()
+        return f"{base_details}, Bonus: ₹{self._bonus}"
+
+    def to_dict(self) -> dict:
+        return {
+            'employee_id': self._employee_id,
+            'name': self._name,
+            'department': self._department,
+            'monthly_salary': self._monthly_salary,
+            'type': 'manager',
+            'bonus': self._bonus
+        }
+
+    def render_row(self) -> str:
+        return self._ROW_TEMPLATE(self._employee_id, self._name, self._department, self.USER_TYPE,
+                                  self._monthly_salary, self._bonus)
+
+
+# Record constructors keyed by the 'type' field of a stored employee
+_CTORS = {
+    'fulltime': lambda e: FullTimeEmployee(e['employee_id'], e['name'], e['department'], e['monthly_salary']),
+    'parttime': lambda e: PartTimeEmployee(e['employee_id'], e['name'], e['department'],
+                                           e['hourly_rate'], e['hours_worked_per_month']),
+    'manager': lambda e: Manager(e['employee_id'], e['name'], e['department'], e['monthly_salary'], e['bonus']),
+}
+
+# Company Class
+class Company:
+    # Fraction of stale lines (tombstones and superseded records) in the data
+    # file that triggers compaction
+    COMPACT_RATIO = 0.25
+    # Number of distinct name searches whose results are kept
+    SEARCH_CACHE_SIZE = 128
+
+    def __init__(self, data_file: str = 'employees.jsonl'):
+        self._employees = {}
+        self._data_file = data_file
+        self._dirty = False
+        self._pending = []
+        self._line_count = 0
+        # Last write failure, kept for the main thread to report since the
+        # writer thread must not print over the menu
+        self._save_error = None
+        self._name_lower = {}
+        self._name_index = defaultdict(list)
+        self._name_corpus = None
+        self._corpus_ids = []
+        self._corpus_starts = []
+        self._search_cache = OrderedDict()
+        # Employees keyed by (department, employee_id) so the payroll report
+        # iterates in department order without sorting on every call
+        if SortedDict is not None:
+            self._by_dept = SortedDict()
+            self._dept_key = {}
+        self._total_cache = None
+        self._salary_cache = {}
+        # Struct-of-arrays mirror of the salary fields for vectorized payroll.
+        # Row i describes self._ids[i]; self._row maps an id back to its row.
+        self._ids = []
+        self._row = {}
+        if np is not None:
+            self._type_code = np.zeros(0, dtype=np.int8)
+            self._monthly = np.zeros(0)
+            self._hourly = np.zeros(0)
+            self._hours = np.zeros(0)
+            self._bonus = np.zeros(0)
+        # Disk writes happen on a background thread so the menu never waits
+        # on I/O. _lock guards the in-memory state shared with that thread and
+        # is never held during file I/O; _io_lock keeps writes to the data file
+        # in order when flush() is also called from the main thread.
+        self._lock = threading.RLock()
+        self._io_lock = threading.RLock()
+        self._load_data()
+        self._save_queue = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        atexit.register(self.close)
+
+    def _load_data(self):
+        # The data file is newline-delimited JSON: one employee record per line,
+        # with {"_tombstone": id} lines marking removals. Later lines win.
+        try:
+            skipped = 0
+            with open(self._data_file, 'rb') as file, _mapped(file) as view:
+                for line in _iter_lines(view):
+                    # Only lines that start with whitespace are copied to check for blanks
+                    if not line or (line[0] in _WHITESPACE and not bytes(line).strip()):
+                        continue
+                    try:
+                        emp = _json_loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        # A torn line may end mid-character, which the stdlib
+                        # fallback reports as a decode error rather than bad JSON
+                        skipped += 1
+                        continue
+                    self._line_count += 1
+                    if '_tombstone' in emp:
+                        self._drop_employee(emp['_tombstone'])
+                        continue
+                    ctor = _CTORS.get(emp.get('type'))
+                    if ctor is not None:
+                        self._store_employee(ctor(emp))
+            if skipped:
+                # Rewrite the file so later appends never land after a torn line
+                print(f"Skipped {skipped} invalid record(s) in {self._data_file}.")
+                self.compact()
+        except FileNotFoundError:
+            self._load_legacy_data()
+
+    def _load_legacy_data(self):
+        # Import a pre-JSONL employees.json array once, then rewrite it as JSONL
+        legacy_file = os.path.splitext(self._data_file)[0] + '.json'
+        if legacy_file == self._data_file or not os.path.exists(legacy_file):
+            print("No existing employee data found. Starting with empty database.")
+            return
+        try:
+            with open(legacy_file, 'rb') as file:
+                # Stream the array with ijson when available so only one
+                # record is held in memory at a time
+                if ijson is not None:
+                    data = ijson_backend.items(file, 'item', use_float=True)
+                else:
+                    with _mapped(file) as view:
+                        data = _json_loads(view)
+                for emp in data:
+                    ctor = _CTORS.get(emp.get('type'))
+                    if ctor is not None:
+                        self._store_employee(ctor(emp))
+        except _JSON_ERRORS:
+            print("Invalid JSON file format. Starting with empty database.")
+            for employee_id in list(self._employees):
+                self._drop_employee(employee_id)
+            return
+        print(f"Migrated {len(self._employees)} employee(s) from {legacy_file}.")
+        self.compact()
+
+    def compact(self) -> bool:
+        tmp_file = self._data_file + '.tmp'
+        with self._io_lock:
+            # Snapshot under the lock, serialize and write without it. Changes
+            # made meanwhile land in the new _pending and are appended later.
+            with self._lock:
+                employees = list(self._employees.values())
+                pending, self._pending = self._pending, []
+                self._dirty = False
+            try:
+                with open(tmp_file, 'wb') as file:
+                    file.write(b''.join(_json_dumps(employee.to_dict()) + b'\n'
+                                        for employee in employees))
+                # Atomic swap so a crash mid-write never leaves a torn data file
+                os.replace(tmp_file, self._data_file)
+            except Exception as e:
+                with self._lock:
+                    self._pending[:0] = pending
+                    self._dirty = True
+                    self._save_error = e
+                return False
+            with self._lock:
+                self._line_count = len(employees) + len(self._pending)
+                self._save_error = None
+            return True
+
+    def _store_employee(self, employee: Employee):
+        employee_id = employee.employee_id
+        if employee_id in self._employees:
+            self._drop_employee(employee_id)
+        self._employees[employee_id] = employee
+        employee._company = self
+        self._total_cache = None
+        if np is not None:
+            self._soa_insert(employee)
+        if SortedDict is not None:
+            self._index_department(employee)
+        name_lower = employee.name.lower()
+        self._name_lower[employee_id] = name_lower
+        self._name_index[name_lower].append(employee_id)
+        self._name_corpus = None
+        self._search_cache.clear()
+
+    def _drop_employee(self, employee_id: str):
+        employee = self._employees.pop(employee_id, None)
+        if employee is None:
+            return
+        # Detach so later setter calls on this object are not persisted
+        employee._company = None
+        self._total_cache = None
+        self._salary_cache.pop(employee_id, None)
+        if np is not None:
+            self._soa_delete(employee_id)
+        if SortedDict is not None:
+            del self._by_dept[self._dept_key.pop(employee_id)]
+        name_lower = self._name_lower.pop(employee_id)
+        ids = self._name_index[name_lower]
+        ids.remove(employee_id)
+        if not ids:
+            del self._name_index[name_lower]
+        self._name_corpus = None
+        self._search_cache.clear()
+
+    def _soa_write(self, row: int, employee: Employee):
+        if isinstance(employee, Manager):
+            self._type_code[row] = 2
+            self._monthly[row] = employee.monthly_salary
+            self._bonus[row] = employee.bonus
+        elif isinstance(employee, PartTimeEmployee):
+            self._type_code[row] = 1
+            self._hourly[row] = employee.hourly_rate
+            self._hours[row] = employee.hours_worked_per_month
+        else:
+            self._type_code[row] = 0
+            self._monthly[row] = employee.calculate_salary()
+
+    def _soa_insert(self, employee: Employee):
+        row = len(self._ids)
+        if row == len(self._type_code):
+            capacity = max(16, 2 * row)
+            for attr in ('_type_code', '_monthly', '_hourly', '_hours', '_bonus'):
+                old = getattr(self, attr)
+                grown = np.zeros(capacity, dtype=old.dtype)
+                grown[:row] = old
+                setattr(self, attr, grown)
+        self._ids.append(employee.employee_id)
+        self._row[employee.employee_id] = row
+        self._soa_write(row, employee)
+
+    def _soa_delete(self, employee_id: str):
+        # Move the last row into the freed slot to keep the arrays dense
+        row = self._row.pop(employee_id)
+        last = len(self._ids) - 1
+        last_id = self._ids.pop()
+        if row != last:
+            self._ids[row] = last_id
+            self._row[last_id] = row
+            for arr in (self._type_code, self._monthly, self._hourly, self._hours, self._bonus):
+                arr[row] = arr[last]
+        for arr in (self._type_code, self._monthly, self._hourly, self._hours, self._bonus):
+            arr[last] = 0
+
+    def _index_department(self, employee: Employee):
+        key = self._dept_key.get(employee.employee_id)
+        if key is not None:
+            del self._by_dept[key]
+        key = self._dept_key[employee.employee_id] = (employee.department, employee.employee_id)
+        self._by_dept[key] = employee
+
+    def _employees_by_department(self):
+        if SortedDict is not None:
+            return self._by_dept.values()
+        return sorted(self._employees.values(), key=lambda e: (e.department, e.employee_id))
+
+    def _employee_changed(self, employee: Employee):
+        with self._lock:
+            self._total_cache = None
+            self._salary_cache.pop(employee.employee_id, None)
+            if np is not None:
+                self._soa_write(self._row[employee.employee_id], employee)
+            if SortedDict is not None:
+                self._index_department(employee)
+            # Persist the new field values; the later line supersedes the old record
+            self._append_record(employee.to_dict())
+
+    def _salary_of(self, employee: Employee) -> float:
+        salary = self._salary_cache.get(employee.employee_id)
+        if salary is None:
+            salary = self._salary_cache[employee.employee_id] = employee.calculate_salary()
+        return salary
+
+    def _append_record(self, record: dict):
+        # The line count includes buffered records so flush() can decide on compaction
+        self._dirty = True
+        self._pending.append(_json_dumps(record) + b'\n')
+        self._line_count += 1
+        self._save_queue.put(1)
+
+    def _writer_loop(self):
+        while True:
+            stop = self._save_queue.get() is None
+            # Coalesce every signal already queued into a single flush
+            while not self._save_queue.empty():
+                stop = self._save_queue.get_nowait() is None or stop
+            # Any failure is kept for the main thread; the writer keeps running
+            # so the next change retries the write
+            try:
+                self.flush()
+            except Exception as e:
+                with self._lock:
+                    self._save_error = e
+            if stop:
+                return
+
+    def flush(self):
+        with self._io_lock:
+            with self._lock:
+                # Read-only sessions never touch the disk
+                if not self._dirty:
+                    return
+                if self._line_count - len(self._employees) > self._line_count * self.COMPACT_RATIO:
+                    pending = None
+                else:
+                    pending, self._pending = self._pending, []
+                    self._dirty = False
+            if pending is None:
+                self.compact()
+                return
+            try:
+                with open(self._data_file, 'ab') as file:
+                    file.write(b''.join(pending))
+                # A later successful write means nothing is left unsaved
+                self._save_error = None
+            except Exception as e:
+                # Put the lines back ahead of anything buffered since
+                with self._lock:
+                    self._pending[:0] = pending
+                    self._dirty = True
+                    self._save_error = e
+
+    def close(self):
+        # Stop the writer after it has flushed everything queued so far
+        if self._writer_thread.is_alive():
+            self._save_queue.put(None)
+            self._writer_thread.join()
+        self.flush()
+        error = self.take_save_error()
+        if error is not None:
+            print(f"Error saving data: {error}")
+
+    def take_save_error(self):
+        # Return the last write failure once, clearing it
+        with self._lock:
+            error, self._save_error = self._save_error, None
+            return error
+
+    def add_employee(self, employee: Employee) -> bool:
+        with self._lock:
+            if employee.employee_id in self._employees:
+                return False
+            self._store_employee(employee)
+            self._append_record(employee.to_dict())
+            return True
+
+    def remove_employee(self, employee_id: str) -> bool:
+        with self._lock:
+            if employee_id in self._employees:
+                self._drop_employee(employee_id)
+                self._append_record({'_tombstone': employee_id})
+                return True
+            return False
+
+    def find_employee(self, employee_id: str):
+        return self._employees.get(employee_id, None)
+
+    def _scan_names(self, key: str):
+        # All lowercased names joined into one newline-terminated string, so a
+        # substring search is a series of C-level str.find calls that only
+        # returns to Python once per match. Rebuilt lazily after mutations.
+        if self._name_corpus is None:
+            self._corpus_ids = list(self._name_lower)
+            self._corpus_starts = [0]
+            for name_lower in self._name_lower.values():
+                self._corpus_starts.append(self._corpus_starts[-1] + len(name_lower) + 1)
+            self._name_corpus = '\n'.join(self._name_lower.values()) + '\n' if self._name_lower else ''
+        corpus, starts, ids = self._name_corpus, self._corpus_starts, self._corpus_ids
+        end = len(corpus)
+        found = []
+        pos = corpus.find(key)
+        while pos != -1 and pos < end:
+            row = bisect_right(starts, pos) - 1
+            found.append(ids[row])
+            pos = corpus.find(key, starts[row + 1])
+        return found
+
+    def search_employee_by_name(self, name: str):
+        # Results are kept in an LRU keyed by the lowercased query and dropped
+        # whenever an employee is added or removed
+        key = name.lower()
+        cached = self._search_cache.get(key)
+        if cached is None:
+            cached = self._search_cache[key] = self._search_impl(key)
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(key)
+        return list(cached)
+
+    def _search_impl(self, key: str):
+        # Exact name matches first, then prefix matches, then any other substring match
+        if '\n' in key:
+            return []
+        exact = self._name_index.get(key, [])
+        prefix = []
+        substring = []
+        for employee_id in self._scan_names(key):
+            name_lower = self._name_lower[employee_id]
+            if name_lower == key:
+                continue
+            (prefix if name_lower.startswith(key) else substring).append(employee_id)
+        return [self._employees[employee_id] for employee_id in chain(exact, prefix, substring)]
+
+    def calculate_total_payroll(self) -> float:
+        if self._total_cache is None:
+            n = len(self._ids)
+            if HAS_NUMBA:
+                self._total_cache = _payroll_kernel(
+                    self._type_code[:n], self._monthly[:n], self._hourly[:n],
+                    self._hours[:n], self._bonus[:n])
+            elif np is not None:
+                t = self._type_code[:n]
+                self._total_cache = float(np.sum(np.where(
+                    t == 1,
+                    self._hourly[:n] * self._hours[:n],
+                    self._monthly[:n] + np.where(t == 2, self._bonus[:n], 0.0))))
+            else:
+                total = 0
+                for employee in self._employees.values():
+                    total += self._salary_of(employee)
+                self._total_cache = total
+        return self._total_cache
+
+    def display_all_employees(self):
+        if not self._employees:
+            print("No employees found.")
+            return
+
+        # Build the whole report and write it once instead of printing per row
+        lines = [
+            "\n" + "="*80,
+            "ALL EMPLOYEES",
+            "="*80,
+            f"{'ID':<10} {'Name':<20} {'Department':<15} {'User Type':<15} {'Details'}",
+            "-"*80,
+        ]
+        lines.extend(employee.render_row() for employee in self._employees.values())
+        lines.append("="*80)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def generate_payroll_report(self):
+        if not self._employees:
+            print("No employees found.")
+            return
+
+        lines = [
+            "\n" + "="*100,
+            "PAYROLL REPORT",
+            "="*100,
+            f"{'ID':<10} {'Name':<20} {'Dept':<15} {'Type':<15} {'Salary':<15}",
+            "-"*100,
+        ]
+        total_payroll = 0
+        for employee in self._employees_by_department():
+            salary = self._salary_of(employee)
+            total_payroll += salary
+            lines.append(_PAY_FMT(employee.employee_id, employee.name, employee.department,
+                                  employee.USER_TYPE, salary))
+        lines.append("-"*100)
+        lines.append(f"{'TOTAL PAYROLL:':<75} ₹{total_payroll:.2f}")
+        lines.append("="*100)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+# Main Application Interface
+def main():
+    company = Company()
+
+    while True:
+        # Report background write failures before the next menu
+        error = company.take_save_error()
+        if error is not None:
+            print(f"\nError saving data: {error}")
+
+        print("\n" + "="*50)
+        print("EMPLOYEE MANAGEMENT SYSTEM v1.0\n \t\t\t By Jai , Aditya & Himanshu")
+        print("="*50)
+        print("1. Add Employee")
+        print("2. Remove Employee")
+        print("3. Search Employee by ID")
+        print("4. Search Employee by Name")
+        print("5. Display All Employees")
+        print("6. Calculate Total Payroll")
+        print("7. Generate Payroll Report")
+        print("8. Exit")
+        print("="*50)
+
+        try:
+            choice = input("Enter your choice (1-8): ").strip()
+
+            if choice == '1':
+                while True:
+                    print("\nEmployee Types:")
+                    print("1. Full-time Employee")
+                    print("2. Part-time Employee")
+                    print("3. Manager")
+                    print("0. Back to Main Menu")
+
+                    emp_type = input("Select employee type (0-3): ").strip()
+                    if emp_type == '0':
+                        break
+
+                    emp_id = input("Enter Employee ID: ").strip()
+                    if company.find_employee(emp_id):
+                        print("Employee with this ID already exists!")
+                        continue
+
+                    name = input("Enter Employee Name: ").strip()
+                    department = input("Enter Department: ").strip()
+
+                    if emp_type == '1':
+                        try:
+                            monthly_salary = float(input("Enter Monthly Salary: ₹"))
+                            employee = FullTimeEmployee(emp_id, name, department, monthly_salary)
+                        except ValueError:
+                            print("Invalid salary amount!")
+                            continue
+
+                    elif emp_type == '2':
+                        try:
+                            hourly_rate = float(input("Enter Hourly Rate: ₹"))
+                            hours_worked = float(input("Enter Hours Worked per Month: "))
+                            employee = PartTimeEmployee(emp_id, name, department, hourly_rate, hours_worked)
+                        except ValueError:
+                            print("Invalid input!")
+                            continue
+
+                    elif emp_type == '3':
+                        try:
+                            monthly_salary = float(input("Enter Monthly Salary: ₹"))
+                            bonus = float(input("Enter Monthly Bonus: ₹"))
+                            employee = Manager(emp_id, name, department, monthly_salary, bonus)
+                        except ValueError:
+                            print("Invalid input!")
+                            continue
+
+                    else:
+                        print("Invalid employee type!")
+                        continue
+
+                    if company.add_employee(employee):
+                        print("Employee added successfully!")
+                    else:
+                        print("Failed to add employee!")
+                    break
+
+            elif choice == '2':
+                emp_id = input("Enter Employee ID to remove (or 0 to cancel): ").strip()
+                if emp_id == '0':
+                    continue
+                if company.remove_employee(emp_id):
+                    print("Employee removed successfully!")
+                else:
+                    print("Employee not found!")
+
+            elif choice == '3':
+                emp_id = input("Enter Employee ID to search (or 0 to cancel): ").strip()
+                if emp_id == '0':
+                    continue
+                employee = company.find_employee(emp_id)
+                if employee:
+                    print("\nEmployee Found:")
+                    print("-" * 40)
+                    print(employee.display_details())
+                    print(f"Monthly Salary: ₹{employee.calculate_salary():.2f}")
+                else:
+                    print("Employee not found!")
+
+            elif choice == '4':
+                name = input("Enter Employee Name to search (or 0 to cancel): ").strip()
+                if name == '0':
+                    continue
+                employees = company.search_employee_by_name(name)
+                if employees:
+                    print(f"\nFound {len(employees)} employee(s):")
+                    print("-" * 40)
+                    for emp in employees:
+                        print(emp.display_details())
+                else:
+                    print("No employees found with that name!")
+
+            elif choice == '5':
+                company.display_all_employees()
+
+            elif choice == '6':
+                total = company.calculate_total_payroll()
+                print(f"\nTotal Company Payroll: ₹{total:.2f}")
+
+            elif choice == '7':
+                company.generate_payroll_report()
+
+            elif choice == '8':
+                company.close()
+                print("Thank you for using Employee Management System!")
+                break
+
+            else:
+                print("Invalid choice! Please enter a number between 1-8.")
+
+        except KeyboardInterrupt:
+            print("\n\nExiting Employee Management System...")
+            break
+        except Exception as e:
+            print(f"An error occurred: {e}")
+
+if __name__ == "__main__":
+    main()
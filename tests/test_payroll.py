@@ -0,0 +1,62 @@
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import Employee_management as em
+
+
+# The vectorized payroll total must match the per-object salaries after
+# adds, removes (swap with the last row) and setter changes
+@unittest.skipUnless(em.np is not None, "numpy not installed")
+class PayrollColumnsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.company = em.Company(os.path.join(self._tmp.name, 'employees.jsonl'))
+        rng = random.Random(1)
+        ids = []
+        # Enough rows to grow the columns several times
+        for i in range(500):
+            kind = rng.randrange(3)
+            if kind == 0:
+                employee = em.FullTimeEmployee(str(i), 'n', 'd', rng.randrange(1000))
+            elif kind == 1:
+                employee = em.PartTimeEmployee(str(i), 'n', 'd', rng.randrange(50), rng.randrange(100))
+            else:
+                employee = em.Manager(str(i), 'n', 'd', rng.randrange(1000), rng.randrange(100))
+            self.company.add_employee(employee)
+            ids.append(str(i))
+        # Cache a total so the later changes must invalidate it
+        self.company.calculate_total_payroll()
+        for employee_id in rng.sample(ids, 200):
+            self.company.remove_employee(employee_id)
+        for employee in list(self.company._employees.values())[:50]:
+            if isinstance(employee, em.Manager):
+                employee.bonus = 7
+            elif isinstance(employee, em.PartTimeEmployee):
+                employee.hours_worked_per_month = 3
+            else:
+                employee.monthly_salary = 11
+
+    def tearDown(self):
+        self.company.close()
+        self._tmp.cleanup()
+
+    def expected_total(self):
+        return sum(e.calculate_salary() for e in self.company._employees.values())
+
+    @unittest.skipUnless(em.HAS_NUMBA, "numba not installed")
+    def test_numba_kernel(self):
+        self.assertAlmostEqual(self.company.calculate_total_payroll(), self.expected_total())
+
+    def test_numpy_columns(self):
+        with mock.patch.object(em, 'HAS_NUMBA', False):
+            self.assertAlmostEqual(self.company.calculate_total_payroll(), self.expected_total())
+
+
+if __name__ == '__main__':
+    unittest.main()